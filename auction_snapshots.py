@@ -0,0 +1,166 @@
+import threading
+import time
+import weakref
+from concurrent.futures import wait
+from dataclasses import dataclass, field
+from typing import Any
+
+# ── Auction Snapshots ──
+
+SNAPSHOT_RESOURCES = {
+    "items": "list_items",
+    "bids": "list_bids",
+    "participants": "list_participants",
+    "results": "get_results",
+    "audit_logs": "get_audit_logs",
+}
+
+_thread_state = threading.local()
+
+def _thread_client(client):
+    """Return the calling worker thread's own clone of ``client``."""
+    clones = getattr(_thread_state, "clones", None)
+    if clones is None:
+        clones = _thread_state.clones = weakref.WeakKeyDictionary()
+    if client not in clones:
+        clones[client] = client.clone()
+    return clones[client]
+
+def _current_rate_limit(a, b):
+    """Pick the later reset window, then the fewest remaining requests in it."""
+    if a is None or b is None:
+        return a if b is None else b
+    if a.reset != b.reset:
+        return a if a.reset > b.reset else b
+    return a if a.remaining <= b.remaining else b
+
+@dataclass
+class AuctionSnapshot:
+    """Per-auction resources, tracked separately so each can refresh on its own."""
+    auction_id: str
+    data: dict = field(default_factory=dict)
+    errors: dict = field(default_factory=dict)
+    fetched_at: dict = field(default_factory=dict)
+    failures: dict = field(default_factory=dict)
+
+    def get(self, name: str) -> Any:
+        """Return a resource, re-raising the error it failed with, if any."""
+        if name in self.errors:
+            raise self.errors[name]
+        return self.data[name]
+
+class AuctionSnapshotLoader:
+    """Fetches auction resources in parallel and keeps them for reuse.
+
+    Resources older than ``max_age`` are served while a refresh runs in the
+    background; past ``max_stale`` the page waits for fresh data. Failed
+    resources are retried with exponential backoff, and a page only waits on
+    the resources it needs. Fetches run on a shared ``executor`` and each
+    worker thread uses its own clone of ``client``. Neighbors are not
+    prefetched once fewer than ``min_remaining`` requests are known to be left.
+    """
+
+    def __init__(self, client, executor, max_age: float = 30.0, max_stale: float = 120.0,
+                 retry_base: float = 5.0, retry_max: float = 60.0, min_remaining: int = 25):
+        self.client = client
+        self.max_age = max_age
+        self.max_stale = max_stale
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.min_remaining = min_remaining
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._rate_limit = None
+        self._snapshots: dict = {}
+        self._pending: dict = {}
+
+    @property
+    def rate_limit(self):
+        """The most current rate limit seen by the loader or the main client."""
+        with self._lock:
+            return _current_rate_limit(self._rate_limit, self.client.rate_limit)
+
+    def _fetch(self, name: str, auction_id: str) -> Any:
+        client = _thread_client(self.client)
+        try:
+            return getattr(client, SNAPSHOT_RESOURCES[name])(auction_id)
+        finally:
+            if client.rate_limit is not None:
+                with self._lock:
+                    self._rate_limit = _current_rate_limit(self._rate_limit, client.rate_limit)
+
+    def _age(self, snapshot: AuctionSnapshot, name: str) -> float:
+        return time.monotonic() - snapshot.fetched_at[name]
+
+    def _due(self, snapshot: AuctionSnapshot, name: str) -> bool:
+        if name not in snapshot.fetched_at:
+            return True
+        if name in snapshot.errors:
+            backoff = self.retry_base * 2 ** (snapshot.failures[name] - 1)
+            return self._age(snapshot, name) >= min(backoff, self.retry_max)
+        return self._age(snapshot, name) > self.max_age
+
+    def _must_wait(self, snapshot: AuctionSnapshot, name: str) -> bool:
+        if name not in snapshot.fetched_at:
+            return True
+        if name in snapshot.errors:
+            return self._due(snapshot, name)
+        return self._age(snapshot, name) > self.max_stale
+
+    def _collect(self, auction_id: str, block_on: tuple = ()) -> AuctionSnapshot:
+        if block_on:
+            wait([self._pending[(auction_id, name)] for name in block_on])
+        snapshot = self._snapshots.setdefault(auction_id, AuctionSnapshot(auction_id))
+        for name in SNAPSHOT_RESOURCES:
+            future = self._pending.get((auction_id, name))
+            if future is None or not future.done():
+                continue
+            del self._pending[(auction_id, name)]
+            snapshot.fetched_at[name] = time.monotonic()
+            error = future.exception()
+            if error is None:
+                snapshot.data[name] = future.result()
+                snapshot.errors.pop(name, None)
+                snapshot.failures.pop(name, None)
+            else:
+                snapshot.data.pop(name, None)
+                snapshot.errors[name] = error
+                snapshot.failures[name] = snapshot.failures.get(name, 0) + 1
+        return snapshot
+
+    def _quota_low(self) -> bool:
+        rate_limit = self.rate_limit
+        return rate_limit is not None and rate_limit.remaining < self.min_remaining
+
+    def prefetch(self, auction_id: str) -> AuctionSnapshot:
+        """Start fetching any resources that are missing, stale or due for retry."""
+        snapshot = self._collect(auction_id)
+        for name in SNAPSHOT_RESOURCES:
+            if (auction_id, name) not in self._pending and self._due(snapshot, name):
+                self._pending[(auction_id, name)] = self._executor.submit(self._fetch, name, auction_id)
+        return snapshot
+
+    def load(self, auction_id: str, needs: tuple = tuple(SNAPSHOT_RESOURCES),
+             neighbors: tuple = ()) -> AuctionSnapshot:
+        """Return a snapshot for an auction and prefetch its neighbors.
+
+        Waits only for the resources in ``needs`` that are missing, older
+        than ``max_stale``, or failed and due for a retry.
+        """
+        snapshot = self.prefetch(auction_id)
+        if not self._quota_low():
+            for neighbor_id in neighbors:
+                self.prefetch(neighbor_id)
+        block_on = tuple(
+            name for name in needs
+            if (auction_id, name) in self._pending and self._must_wait(snapshot, name)
+        )
+        if block_on:
+            self._collect(auction_id, block_on=block_on)
+        return snapshot
+
+    def invalidate(self, auction_id: str) -> None:
+        """Drop cached data and cancel queued fetches after the auction was modified."""
+        self._snapshots.pop(auction_id, None)
+        for key in [key for key in self._pending if key[0] == auction_id]:
+            self._pending.pop(key).cancel()
@@ -1,5 +1,6 @@
 import streamlit as st
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional, Any
 from datetime import datetime, timedelta
@@ -7,6 +8,8 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
+from auction_snapshots import AuctionSnapshotLoader
+
 # ── Boli Auctions Python SDK ──
 
 @dataclass
@@ -19,6 +22,7 @@ class BoliClient:
     """Enterprise client for the Boli Auctions API."""
 
     def __init__(self, api_key: str, base_url: str = "https://dcobznuyvfgeskkjbwdf.supabase.co/functions/v1/api-gateway"):
+        self.api_key = api_key
         self.base_url = base_url
         self.session = requests.Session()
         self.session.headers.update({
@@ -29,14 +33,19 @@ class BoliClient:
 
     def _request(self, method: str, path: str, json: Any = None) -> dict:
         r = self.session.request(method, f"{self.base_url}{path}", json=json)
-        self.rate_limit = RateLimit(
-            limit=int(r.headers.get("X-RateLimit-Limit", 100)),
-            remaining=int(r.headers.get("X-RateLimit-Remaining", 0)),
-            reset=int(r.headers.get("X-RateLimit-Reset", 0)),
-        )
+        if "X-RateLimit-Remaining" in r.headers:
+            self.rate_limit = RateLimit(
+                limit=int(r.headers.get("X-RateLimit-Limit", 100)),
+                remaining=int(r.headers["X-RateLimit-Remaining"]),
+                reset=int(r.headers.get("X-RateLimit-Reset", 0)),
+            )
         r.raise_for_status()
         return r.json()
 
+    def clone(self) -> "BoliClient":
+        """Return a new client with the same credentials and its own session."""
+        return BoliClient(self.api_key, self.base_url)
+
     # ── Auctions ──
     def list_auctions(self) -> list:
         return self._request("GET", "/auctions")["auctions"]
@@ -145,6 +154,15 @@ def get_client():
 
 client = get_client()
 
+@st.cache_resource
+def get_snapshot_executor():
+    """Worker pool for auction snapshot fetches, shared by all sessions."""
+    return ThreadPoolExecutor(max_workers=8)
+
+if "snapshot_loader" not in st.session_state:
+    st.session_state.snapshot_loader = AuctionSnapshotLoader(client, get_snapshot_executor())
+snapshot_loader = st.session_state.snapshot_loader
+
 # ── Sidebar Navigation ──
 
 st.sidebar.title("🔨 Boli Auctions")
@@ -156,9 +174,10 @@ page = st.sidebar.radio(
 )
 
 # Display rate limit info
-if client.rate_limit:
+rate_limit = snapshot_loader.rate_limit
+if rate_limit:
     st.sidebar.markdown("---")
-    st.sidebar.metric("API Rate Limit", f"{client.rate_limit.remaining}/{client.rate_limit.limit}")
+    st.sidebar.metric("API Rate Limit", f"{rate_limit.remaining}/{rate_limit.limit}")
 
 st.sidebar.markdown("---")
 st.sidebar.caption("Boli Auctions Manager v1.0")
@@ -185,6 +204,13 @@ def get_status_color(status):
     }
     return colors.get(status, "⚪")
 
+def load_snapshot(auction_options, selected, needs):
+    """Load the selected auction's snapshot, prefetching adjacent options."""
+    auction_ids = list(auction_options.values())
+    index = list(auction_options.keys()).index(selected)
+    neighbors = tuple(auction_ids[i] for i in (index - 1, index + 1) if 0 <= i < len(auction_ids))
+    return snapshot_loader.load(auction_ids[index], needs=needs, neighbors=neighbors)
+
 # ── Page: Dashboard ──
 
 if page == "📊 Dashboard":
@@ -364,6 +390,7 @@ elif page == "🎯 Auctions":
                         if st.button("🟢 Set to Live", use_container_width=True):
                             try:
                                 client.update_auction(auction_id, status="live")
+                                snapshot_loader.invalidate(auction_id)
                                 st.success("Auction is now live!")
                                 st.rerun()
                             except Exception as e:
@@ -373,6 +400,7 @@ elif page == "🎯 Auctions":
                         if st.button("🔴 End Auction", use_container_width=True):
                             try:
                                 client.update_auction(auction_id, status="ended")
+                                snapshot_loader.invalidate(auction_id)
                                 st.success("Auction ended!")
                                 st.rerun()
                             except Exception as e:
@@ -382,6 +410,7 @@ elif page == "🎯 Auctions":
                         if st.button("🗑️ Delete Auction", use_container_width=True, type="secondary"):
                             try:
                                 client.delete_auction(auction_id)
+                                snapshot_loader.invalidate(auction_id)
                                 st.success("Auction deleted!")
                                 st.rerun()
                             except Exception as e:
@@ -408,6 +437,7 @@ elif page == "📦 Items":
             
             if selected:
                 auction_id = auction_options[selected]
+                snapshot = load_snapshot(auction_options, selected, needs=("items",))
                 
                 tab1, tab2 = st.tabs(["📋 View Items", "➕ Add Item"])
                 
@@ -415,7 +445,7 @@ elif page == "📦 Items":
                     st.subheader("Auction Items")
                     
                     try:
-                        items = client.list_items(auction_id)
+                        items = snapshot.get("items")
                         
                         if items:
                             for item in items:
@@ -434,6 +464,7 @@ elif page == "📦 Items":
                                         if st.button(f"Delete", key=f"del_{item['id']}"):
                                             try:
                                                 client.delete_item(auction_id, item['id'])
+                                                snapshot_loader.invalidate(auction_id)
                                                 st.success("Item deleted!")
                                                 st.rerun()
                                             except Exception as e:
@@ -468,6 +499,7 @@ elif page == "📦 Items":
                                         item_data["description"] = description
                                     
                                     item = client.add_item(auction_id, **item_data)
+                                    snapshot_loader.invalidate(auction_id)
                                     st.success(f"✅ Item added successfully! ID: {item['id']}")
                                     st.json(item)
                                     st.rerun()
@@ -494,6 +526,7 @@ elif page == "💰 Bids & Results":
             
             if selected:
                 auction_id = auction_options[selected]
+                snapshot = load_snapshot(auction_options, selected, needs=("bids", "results"))
                 
                 tab1, tab2 = st.tabs(["💰 Bids", "📊 Results"])
                 
@@ -501,7 +534,7 @@ elif page == "💰 Bids & Results":
                     st.subheader("Auction Bids")
                     
                     try:
-                        bids = client.list_bids(auction_id)
+                        bids = snapshot.get("bids")
                         
                         if bids:
                             df = pd.DataFrame(bids)
@@ -528,7 +561,7 @@ elif page == "💰 Bids & Results":
                     st.subheader("Auction Results")
                     
                     try:
-                        results = client.get_results(auction_id)
+                        results = snapshot.get("results")
                         
                         if results:
                             # Summary metrics
@@ -580,6 +613,7 @@ elif page == "👥 Participants":
             
             if selected:
                 auction_id = auction_options[selected]
+                snapshot = load_snapshot(auction_options, selected, needs=("participants",))
                 
                 tab1, tab2 = st.tabs(["📋 View Participants", "➕ Invite Participant"])
                 
@@ -587,7 +621,7 @@ elif page == "👥 Participants":
                     st.subheader("Auction Participants")
                     
                     try:
-                        participants = client.list_participants(auction_id)
+                        participants = snapshot.get("participants")
                         
                         if participants:
                             df = pd.DataFrame(participants)
@@ -612,6 +646,7 @@ elif page == "👥 Participants":
                             else:
                                 try:
                                     participant = client.invite_participant(auction_id, user_id)
+                                    snapshot_loader.invalidate(auction_id)
                                     st.success(f"✅ Invitation sent successfully!")
                                     st.json(participant)
                                     st.rerun()
@@ -638,9 +673,10 @@ elif page == "📜 Audit Logs":
             
             if selected:
                 auction_id = auction_options[selected]
+                snapshot = load_snapshot(auction_options, selected, needs=("audit_logs",))
                 
                 try:
-                    logs = client.get_audit_logs(auction_id)
+                    logs = snapshot.get("audit_logs")
                     
                     if logs:
                         st.info(f"Found {len(logs)} audit log entries")
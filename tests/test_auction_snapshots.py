@@ -0,0 +1,242 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+import pytest
+
+from auction_snapshots import AuctionSnapshotLoader
+
+
+@dataclass
+class RateLimit:
+    limit: int
+    remaining: int
+    reset: int
+
+
+class StubClient:
+    """Records calls per auction and can be told to fail or hold a resource."""
+
+    def __init__(self, shared=None, remaining=100):
+        self.shared = shared if shared is not None else {
+            "calls": [], "fail": set(), "hold": set(), "gate": threading.Event(),
+            "remaining": remaining, "reset": 0,
+        }
+        self.rate_limit = None
+
+    def clone(self):
+        return StubClient(self.shared)
+
+    def _call(self, name, auction_id):
+        self.shared["calls"].append((name, auction_id))
+        if name in self.shared["hold"]:
+            self.shared["gate"].wait(5)
+        if self.shared["remaining"] is not None:
+            self.rate_limit = RateLimit(100, self.shared["remaining"], self.shared["reset"])
+        if name in self.shared["fail"]:
+            raise RuntimeError("transient")
+        return f"{name}:{auction_id}"
+
+    def list_items(self, auction_id):
+        return self._call("items", auction_id)
+
+    def list_bids(self, auction_id):
+        return self._call("bids", auction_id)
+
+    def list_participants(self, auction_id):
+        return self._call("participants", auction_id)
+
+    def get_results(self, auction_id):
+        return self._call("results", auction_id)
+
+    def get_audit_logs(self, auction_id):
+        return self._call("audit_logs", auction_id)
+
+
+class InlineExecutor:
+    """Runs submitted calls immediately so request counts are deterministic."""
+
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+def calls_for(client, auction_id):
+    return [name for name, aid in client.shared["calls"] if aid == auction_id]
+
+
+def age(snapshot, seconds):
+    for name in snapshot.fetched_at:
+        snapshot.fetched_at[name] -= seconds
+
+
+def test_load_fetches_all_resources_and_reuses_fresh_snapshot():
+    client = StubClient()
+    loader = AuctionSnapshotLoader(client, InlineExecutor())
+
+    snapshot = loader.load("a")
+    assert snapshot.get("items") == "items:a"
+    assert snapshot.get("audit_logs") == "audit_logs:a"
+    loader.load("a")
+    assert len(calls_for(client, "a")) == 5
+
+
+def test_workers_use_cloned_clients():
+    client = StubClient()
+    loader = AuctionSnapshotLoader(client, InlineExecutor())
+
+    loader.load("a")
+    assert client.rate_limit is None
+    assert loader.rate_limit.remaining == 100
+
+
+def test_stale_snapshot_served_while_refreshing():
+    client = StubClient()
+    executor = ThreadPoolExecutor(max_workers=5)
+    loader = AuctionSnapshotLoader(client, executor, max_age=30.0, max_stale=120.0)
+
+    snapshot = loader.load("a")
+    age(snapshot, 60)
+    stale_at = snapshot.fetched_at["items"]
+    assert loader.load("a").fetched_at["items"] == stale_at
+
+    executor.shutdown(wait=True)
+    assert loader.load("a").fetched_at["items"] > stale_at
+    assert len(calls_for(client, "a")) == 10
+
+
+def test_snapshot_past_max_stale_waits_for_refresh():
+    client = StubClient()
+    executor = ThreadPoolExecutor(max_workers=5)
+    loader = AuctionSnapshotLoader(client, executor, max_age=30.0, max_stale=120.0)
+
+    snapshot = loader.load("a")
+    age(snapshot, 300)
+    stale_at = snapshot.fetched_at["items"]
+    assert loader.load("a", needs=("items",)).fetched_at["items"] > stale_at
+    executor.shutdown(wait=True)
+
+
+def test_failed_resource_is_retried_after_backoff():
+    client = StubClient()
+    client.shared["fail"].add("items")
+    loader = AuctionSnapshotLoader(client, InlineExecutor(), retry_base=5.0)
+
+    with pytest.raises(RuntimeError):
+        loader.load("a").get("items")
+
+    client.shared["fail"].clear()
+    snapshot = loader.load("a")
+    with pytest.raises(RuntimeError):
+        snapshot.get("items")
+
+    snapshot.fetched_at["items"] -= 5
+    assert loader.load("a").get("items") == "items:a"
+    assert len(calls_for(client, "a")) == 6
+
+
+def test_persistent_failure_does_not_refetch_on_every_rerun():
+    client = StubClient()
+    client.shared["fail"].add("results")
+    loader = AuctionSnapshotLoader(client, InlineExecutor(), retry_base=5.0)
+
+    sent = []
+    for _ in range(4):
+        before = len(client.shared["calls"])
+        snapshot = loader.load("a", needs=("items",), neighbors=("b", "z"))
+        sent.append(len(client.shared["calls"]) - before)
+    assert sent == [15, 0, 0, 0]
+    assert snapshot.get("items") == "items:a"
+
+    snapshot.fetched_at["results"] -= 5
+    before = len(client.shared["calls"])
+    loader.load("a", needs=("items",))
+    assert client.shared["calls"][before:] == [("results", "a")]
+
+    before = len(client.shared["calls"])
+    loader.load("a", needs=("items",))
+    assert snapshot.failures["results"] == 2
+
+    snapshot.fetched_at["results"] -= 5
+    loader.load("a", needs=("items",))
+    assert len(client.shared["calls"]) == before
+
+
+def test_load_waits_only_for_needed_resources():
+    client = StubClient()
+    client.shared["hold"].add("results")
+    executor = ThreadPoolExecutor(max_workers=5)
+    loader = AuctionSnapshotLoader(client, executor)
+
+    snapshot = loader.load("a", needs=("items",))
+    assert snapshot.get("items") == "items:a"
+    assert "results" not in snapshot.fetched_at
+
+    client.shared["gate"].set()
+    executor.shutdown(wait=True)
+    assert loader.load("a", needs=("results",)).get("results") == "results:a"
+
+
+def test_invalidate_cancels_queued_fetches():
+    client = StubClient()
+    client.shared["hold"].add("items")
+    executor = ThreadPoolExecutor(max_workers=1)
+    loader = AuctionSnapshotLoader(client, executor)
+
+    loader.load("a", needs=())
+    loader.invalidate("a")
+    client.shared["gate"].set()
+    executor.shutdown(wait=True)
+    assert calls_for(client, "a") == ["items"]
+
+
+def test_invalidate_drops_cached_snapshot():
+    client = StubClient()
+    loader = AuctionSnapshotLoader(client, InlineExecutor())
+
+    snapshot = loader.load("a")
+    loader.invalidate("a")
+    assert loader.load("a") is not snapshot
+    assert len(calls_for(client, "a")) == 10
+
+
+def test_neighbors_prefetched_unless_quota_low():
+    client = StubClient()
+    loader = AuctionSnapshotLoader(client, InlineExecutor(), min_remaining=25)
+
+    loader.load("a", neighbors=("b",))
+    assert len(calls_for(client, "b")) == 5
+
+    client.shared["remaining"] = 10
+    loader.load("c")
+    loader.load("d", neighbors=("e",))
+    assert calls_for(client, "e") == []
+
+
+def test_neighbors_prefetched_when_quota_unknown():
+    client = StubClient(remaining=None)
+    loader = AuctionSnapshotLoader(client, InlineExecutor(), min_remaining=25)
+
+    loader.load("a", neighbors=("b",))
+    assert loader.rate_limit is None
+    assert len(calls_for(client, "b")) == 5
+
+
+def test_rate_limit_keeps_lowest_remaining_in_current_window():
+    client = StubClient(remaining=50)
+    client.shared["reset"] = 1
+    client.rate_limit = RateLimit(100, 10, 1)
+    loader = AuctionSnapshotLoader(client, InlineExecutor())
+
+    loader.load("a")
+    assert loader.rate_limit.remaining == 10
+
+    client.shared["reset"] = 2
+    client.shared["remaining"] = 90
+    loader.invalidate("a")
+    loader.load("a")
+    assert loader.rate_limit.remaining == 90